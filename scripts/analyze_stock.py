@@ -3,11 +3,12 @@
 CLI tool for stock analysis
 
 Usage: 
-    python scripts/analyze_stock.py <SYMBOL>
+    python scripts/analyze_stock.py <SYMBOL> [--no-cache]
     
 Example:
     python scripts/analyze_stock.py HDB
     .venv/bin/python scripts/analyze_stock.py HDB
+    python scripts/analyze_stock.py HDB --no-cache   # Bỏ qua cache, fetch lại data
     
 Output:
     - Progress logs to stderr (with professional formatting)
@@ -20,24 +21,29 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from vnstock_analyzer import StockScorer, export_json
-from vnstock_analyzer.utils import get_logger, LogLevel
-
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/analyze_stock.py <SYMBOL>", file=sys.stderr)
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    use_cache = '--no-cache' not in sys.argv[1:]
+    
+    if len(args) < 1:
+        print("Usage: python scripts/analyze_stock.py <SYMBOL> [--no-cache]", file=sys.stderr)
         print("Example: python scripts/analyze_stock.py HDB", file=sys.stderr)
         sys.exit(1)
     
-    symbol = sys.argv[1].upper()
+    symbol = args[0].upper()
+    
+    # Heavy imports (vnstock, pandas, numpy) only after arguments are validated
+    from vnstock_analyzer import StockScorer, export_json
+    from vnstock_analyzer.utils import get_logger, LogLevel
+    
     logger = get_logger('CLI', LogLevel.INFO)
     
     logger.info(f"Starting analysis for {symbol}")
     
     try:
         # Analyze stock với error handling
-        scorer = StockScorer(symbol)
+        scorer = StockScorer(symbol, use_cache=use_cache)
         result = scorer.analyze()
         
         # Check if result contains error
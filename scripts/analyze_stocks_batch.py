@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+CLI tool for batch stock analysis - one process for many symbols
+
+Usage: 
+    python scripts/analyze_stocks_batch.py <SYMBOL> [<SYMBOL> ...] [--no-cache]
+    echo "HDB,FPT,VNM" | python scripts/analyze_stocks_batch.py
+    
+Example:
+    python scripts/analyze_stocks_batch.py HDB FPT VNM
+    
+Output:
+    - Progress logs to stderr
+    - One JSON line per symbol to stdout (NDJSON), in completion order:
+      {"symbol": "HDB", "result": {...}}
+"""
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# vnstock calls are I/O-bound - a few threads overlap network waits
+MAX_WORKERS = 4
+
+
+def read_symbols():
+    """Read symbols from command line arguments or stdin (comma/whitespace separated)"""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if args:
+        return [s.upper() for s in args]
+    
+    input_data = sys.stdin.read().strip()
+    if ',' in input_data:
+        symbols = [s.strip() for s in input_data.split(',')]
+    else:
+        symbols = input_data.split()
+    return [s.upper() for s in symbols if s]
+
+
+def main():
+    symbols = read_symbols()
+    use_cache = '--no-cache' not in sys.argv[1:]
+    
+    if not symbols:
+        print("Usage: python scripts/analyze_stocks_batch.py <SYMBOL> [<SYMBOL> ...] [--no-cache]", file=sys.stderr)
+        print("Example: python scripts/analyze_stocks_batch.py HDB FPT VNM", file=sys.stderr)
+        sys.exit(1)
+    
+    # Heavy imports (vnstock, pandas, numpy) paid once for all symbols
+    from vnstock_analyzer import StockScorer, export_json
+    
+    def analyze_one(symbol):
+        try:
+            return StockScorer(symbol, use_cache=use_cache).analyze()
+        except Exception as e:
+            return {
+                'error': f'Lỗi không mong đợi: {str(e)}',
+                'symbol': symbol
+            }
+    
+    print(f"🚀 Starting analysis for {len(symbols)} symbols...", file=sys.stderr)
+    failed = 0
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        try:
+            futures = {executor.submit(analyze_one, symbol): symbol for symbol in symbols}
+            
+            # Stream each result as soon as it is ready
+            for future in as_completed(futures):
+                symbol = futures[future]
+                result = future.result()
+                if not result or 'error' in result:
+                    failed += 1
+                
+                sys.stdout.write(export_json({'symbol': symbol, 'result': result}, pretty=False) + '\n')
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            # Drop queued symbols - only the analyses already running finish before exit
+            executor.shutdown(wait=False, cancel_futures=True)
+            print("❌ Analysis interrupted by user", file=sys.stderr)
+            sys.exit(130)
+    
+    print(f"\n🎯 Completed: {len(symbols) - failed}/{len(symbols)} symbols analyzed successfully", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
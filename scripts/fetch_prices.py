@@ -4,78 +4,155 @@ Fetch stock prices for Vietnamese stocks using vnstock
 """
 import sys
 import json
-from vnstock import Vnstock
+import time
+import asyncio
+from collections import deque
+from datetime import datetime, timedelta
 
-# Force unbuffered output for real-time logging
-sys.stderr.reconfigure(line_buffering=True) if hasattr(sys.stderr, 'reconfigure') else None
+# orjson is optional - faster JSON output when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def fetch_prices(symbols):
+# Progress lines are flushed in batches (see PROGRESS_FLUSH_EVERY) instead of one flush per line
+sys.stderr.reconfigure(line_buffering=False) if hasattr(sys.stderr, 'reconfigure') else None
+
+# VCI rate limit: 20 requests/minute
+RATE_LIMIT_CALLS = 20
+RATE_LIMIT_PERIOD = 60  # seconds
+MAX_WORKERS = 10
+PROGRESS_FLUSH_EVERY = 8
+
+
+class RateLimiter:
+    """Sliding-window rate limiter: at most `max_calls` starts per `period` seconds"""
+
+    def __init__(self, max_calls, period):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a new request is allowed"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+
+                await asyncio.sleep(self.period - (now - self._calls[0]))
+
+
+async def fetch_prices_async(symbols, max_workers=MAX_WORKERS):
     """
-    Fetch current prices and percent changes for a list of symbols
-    
+    Fetch current prices and percent changes for a list of symbols concurrently
+
     Args:
         symbols: List of stock symbols (e.g., ['ACB', 'VNM', 'HPG'])
-    
+        max_workers: Maximum number of in-flight requests
+
     Returns:
         Dictionary with symbol as key and {price, changePercent} as value
     """
-    results = {}
-    
-    from datetime import datetime, timedelta
-    import time
-    
+    # Imported lazily so bad-argument paths don't pay vnstock's import cost
+    from vnstock import Vnstock
+
     end_date = datetime.now().strftime('%Y-%m-%d')
     start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-    
+
     total = len(symbols)
-    success_count = 0
-    
-    for idx, symbol in enumerate(symbols, 1):
-        try:
-            # Use VCI source
-            stock = Vnstock().stock(symbol=symbol, source='VCI')
-            df = stock.quote.history(start=start_date, end=end_date)
-            
-            if df is not None and not df.empty and len(df) > 0:
-                # Get the latest data
-                latest = df.iloc[-1]
-                close_price = float(latest['close'])
-                
-                # Calculate percent change if we have previous close
-                if len(df) > 1:
-                    prev_close = float(df.iloc[-2]['close'])
-                    change_percent = ((close_price - prev_close) / prev_close) * 100
-                else:
-                    change_percent = 0.0
-                
-                results[symbol] = {
-                    'price': round(close_price, 2),
-                    'changePercent': round(change_percent, 2)
-                }
-                success_count += 1
-                print(f"✅ Progress: {idx}/{total} - {symbol}: {close_price:.2f} ({change_percent:+.1f}%)", file=sys.stderr)
-            else:
-                results[symbol] = {
+    done = 0
+    semaphore = asyncio.Semaphore(max_workers)
+    limiter = RateLimiter(RATE_LIMIT_CALLS, RATE_LIMIT_PERIOD)
+
+    # One root client shared by all symbols - only the per-symbol handle is rebuilt
+    vn = Vnstock()
+
+    def log_progress(line):
+        # All tasks print from the event-loop thread, so lines never interleave
+        print(line, file=sys.stderr)
+        if done % PROGRESS_FLUSH_EVERY == 0 or done == total:
+            sys.stderr.flush()
+
+    async def fetch_one(symbol):
+        nonlocal done
+        async with semaphore:
+            await limiter.acquire()
+            try:
+                # Handle built on the event-loop thread: Vnstock.stock() stores the
+                # symbol on the shared root client, so it must not run concurrently
+                stock = vn.stock(symbol=symbol, source='VCI')
+                # Only the blocking HTTP call goes to a worker thread
+                df = await asyncio.to_thread(stock.quote.history, start=start_date, end=end_date)
+
+                if df is not None and not df.empty:
+                    # Read closes as a plain ndarray - no per-row Series materialization
+                    closes = df['close'].to_numpy()
+                    close_price = float(closes[-1])
+
+                    # Calculate percent change if we have previous close
+                    if closes.size > 1:
+                        prev_close = float(closes[-2])
+                        change_percent = ((close_price - prev_close) / prev_close) * 100
+                    else:
+                        change_percent = 0.0
+
+                    done += 1
+                    log_progress(f"✅ Progress: {done}/{total} - {symbol}: {close_price:.2f} ({change_percent:+.1f}%)")
+                    return {
+                        'price': round(close_price, 2),
+                        'changePercent': round(change_percent, 2)
+                    }
+
+                done += 1
+                log_progress(f"⚠️  Progress: {done}/{total} - {symbol}: No data")
+                return {
                     'price': None,
                     'changePercent': None,
                     'error': 'No data available'
                 }
-                print(f"⚠️  Progress: {idx}/{total} - {symbol}: No data", file=sys.stderr)
-        except Exception as e:
-            results[symbol] = {
+            except Exception as e:
+                done += 1
+                log_progress(f"❌ Progress: {done}/{total} - {symbol}: Error - {str(e)}")
+                return {
+                    'price': None,
+                    'changePercent': None,
+                    'error': str(e)
+                }
+
+    outcomes = await asyncio.gather(*(fetch_one(symbol) for symbol in symbols), return_exceptions=True)
+
+    results = {}
+    for symbol, result in zip(symbols, outcomes):
+        if isinstance(result, BaseException):
+            result = {
                 'price': None,
                 'changePercent': None,
-                'error': str(e)
+                'error': str(result)
             }
-            print(f"❌ Progress: {idx}/{total} - {symbol}: Error - {str(e)}", file=sys.stderr)
-        
-        # Delay to avoid rate limit: 20 requests/minute = 1 request per 3 seconds
-        # Add 0.5s buffer for safety
-        if idx < total:  # Don't sleep after last symbol
-            time.sleep(3.5)
-    
+        results[symbol] = result
+
     return results
 
+
+def fetch_prices(symbols):
+    """
+    Fetch current prices and percent changes for a list of symbols
+
+    Args:
+        symbols: List of stock symbols (e.g., ['ACB', 'VNM', 'HPG'])
+
+    Returns:
+        Dictionary with symbol as key and {price, changePercent} as value
+    """
+    return asyncio.run(fetch_prices_async(symbols))
+
 if __name__ == '__main__':
     # Read symbols from command line arguments or stdin
     if len(sys.argv) > 1:
@@ -88,18 +165,23 @@ if __name__ == '__main__':
             symbols = [s.strip() for s in input_data.split(',')]
         else:
             symbols = input_data.split()
-    
+
     if not symbols:
         print(json.dumps({'error': 'No symbols provided'}))
         sys.exit(1)
-    
+
     # Fetch prices
     print(f"🚀 Starting to fetch prices for {len(symbols)} symbols...", file=sys.stderr)
     results = fetch_prices(symbols)
-    
+
     # Count successes
     success_count = sum(1 for r in results.values() if r.get('price') is not None)
     print(f"\n🎯 Completed: {success_count}/{len(symbols)} symbols fetched successfully", file=sys.stderr)
-    
+
     # Output as JSON
-    print(json.dumps(results, ensure_ascii=False))
+    if orjson is not None:
+        # Write bytes directly - skips the decode -> print -> encode round-trip
+        sys.stdout.buffer.write(orjson.dumps(results) + b'\n')
+        sys.stdout.flush()
+    else:
+        print(json.dumps(results, ensure_ascii=False))
@@ -15,11 +15,23 @@ Usage:
     result = scorer.analyze()
 """
 
-# Apply patches for vnstock compatibility with pandas 3.x
-from . import vnstock_patch
-
-from .scorer import StockScorer
-from .utils import print_report, export_json
-
 __version__ = '1.0.0'
 __all__ = ['StockScorer', 'print_report', 'export_json']
+
+# Lazy exports (PEP 562) - vnstock/pandas/numpy chỉ được import khi thực sự dùng
+_LAZY_EXPORTS = {
+    'StockScorer': '.scorer',
+    'print_report': '.utils',
+    'export_json': '.utils',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,7 +5,41 @@ Simplified to focus 100% on Moving Average analysis.
 All complexity removed - pure MA-based trading signals.
 """
 
-from .technical_modules.ma_analyzer import MAAnalyzer
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .technical_modules.ma_analyzer import MAAnalyzer, score_to_status
+
+
+# Minimum bars for MA analysis (MA50 needs 50 bars) - shorter histories skip indicators entirely
+MIN_HISTORY_BARS = 50
+
+# LRU cache of indicator buffers keyed by close-series content
+# (same bars analyzed again -> no recomputation). Cached buffers are read-only.
+_IND_CACHE = OrderedDict()
+_IND_CACHE_SIZE = 64
+_IND_CACHE_LOCK = threading.Lock()
+
+
+# Indicator buffer column order
+IND_COLUMNS = ('MA10', 'MA20', 'MA50')
+
+
+def _indicator_buffer(columns):
+    """Pack indicator arrays (in IND_COLUMNS order) into one (N, k) float64 column-major buffer"""
+    buffer = np.empty((columns[0].shape[0], len(columns)), dtype=np.float64, order='F')
+    for i, values in enumerate(columns):
+        buffer[:, i] = values
+    return buffer
+
+
+def _close_key(close):
+    """Content fingerprint of a close array (length + blake2b digest)"""
+    return (close.shape[0], hashlib.blake2b(close.tobytes(), digest_size=16).digest())
 
 
 class TechnicalAnalyzer:
@@ -16,29 +50,138 @@ class TechnicalAnalyzer:
     Uses only Price + MA10 + MA20 + MA50 for trading decisions.
     """
     
-    def __init__(self, df_history):
+    def __init__(self, df_history, indicators=None):
         """
         Initialize technical analyzer
         
         Args:
-            df_history: Historical price dataframe
+            df_history: Historical price dataframe (read-only, never mutated; the
+                        combined frame with indicators is only built on first use)
+            indicators: Optional precomputed (N, len(IND_COLUMNS)) float64 buffer aligned
+                        with df_history (e.g. from from_batch) - skips _calculate_indicators
+        """
+        self._src = df_history
+        self._n = 0 if df_history is None else df_history.shape[0]
+        # All indicators in one (N, k) float64 buffer, column-major (each indicator contiguous)
+        self._ind = indicators
+        self._df = None
+        self._ma_analyzer = None
+        if indicators is None:
+            self._calculate_indicators()
+    
+    @classmethod
+    def from_batch(cls, frames_by_symbol):
+        """
+        Build analyzers for many symbols with one batched indicator pass
+        
+        Closes are stacked into a (symbols x time) array and all EMAs are
+        computed together (rows in parallel when numba is available).
+        
+        Args:
+            frames_by_symbol: Dict of {symbol: df_history}
+            
+        Returns:
+            dict: {symbol: TechnicalAnalyzer}
         """
-        self.df = df_history.copy() if df_history is not None else None
-        self._calculate_indicators()
+        # Imported here: batch pulls in numba (optional), which single-symbol runs never need
+        from .technical_modules.batch import stack_closes, compute_indicators_batch
+        
+        batch = [
+            (symbol, df) for symbol, df in frames_by_symbol.items()
+            if df is not None and df.shape[0] >= MIN_HISTORY_BARS
+        ]
+        
+        analyzers = {}
+        if batch:
+            close2d = stack_closes([df['close'].to_numpy(dtype=np.float64) for _, df in batch])
+            indicators = compute_indicators_batch(close2d)
+            t_cols = close2d.shape[1]
+            
+            for k, (symbol, df) in enumerate(batch):
+                start = t_cols - df.shape[0]
+                analyzers[symbol] = cls(df, indicators=_indicator_buffer(
+                    [indicators[name][k, start:] for name in IND_COLUMNS]
+                ))
         
-        # Create MA analyzer only
-        if self.df is not None:
-            self.ma_analyzer = MAAnalyzer(self.df)
+        # Missing/short histories go through the normal path (NA analysis)
+        for symbol, df in frames_by_symbol.items():
+            if symbol not in analyzers:
+                analyzers[symbol] = cls(df)
+        
+        return {symbol: analyzers[symbol] for symbol in frames_by_symbol}
+    
+    @classmethod
+    def score_universe(cls, df_long, symbol_col='symbol'):
+        """
+        Analyze a whole ticker universe given as one long-format frame
+        
+        Args:
+            df_long: DataFrame with a symbol column + OHLCV columns, rows in time order per symbol
+            symbol_col: Name of the symbol column
+            
+        Returns:
+            dict: {symbol: get_analysis() result}
+        """
+        frames_by_symbol = {
+            symbol: group.reset_index(drop=True)
+            for symbol, group in df_long.groupby(symbol_col, sort=False)
+        }
+        analyzers = cls.from_batch(frames_by_symbol)
+        return {symbol: analyzer.get_analysis() for symbol, analyzer in analyzers.items()}
+    
+    @property
+    def ma_analyzer(self):
+        """MAAnalyzer over self.df, created on first access (builds the combined frame)"""
+        if self._ma_analyzer is None and self._src is not None:
+            self._ma_analyzer = MAAnalyzer(self.df)
+        return self._ma_analyzer
+    
+    @property
+    def df(self):
+        """Price history + indicator columns, built on first access"""
+        if self._df is None and self._src is not None:
+            if self._ind is not None:
+                # Indicators replace same-named source columns (like the old in-place assignment)
+                src = self._src.drop(columns=list(IND_COLUMNS), errors='ignore')
+                ind = pd.DataFrame(
+                    self._ind,
+                    index=self._src.index,
+                    columns=list(IND_COLUMNS)
+                )
+                self._df = pd.concat([src, ind], axis=1)
+            else:
+                self._df = self._src
+        return self._df
         
     def _calculate_indicators(self):
         """Calculate Moving Averages only - Use EMA to match TradingView"""
-        if self.df is None or len(self.df) == 0:
+        # Too short for MA analysis - get_analysis() returns NA without reading them
+        if self._n < MIN_HISTORY_BARS:
             return
         
         # Moving Averages - EMA (Exponential) for faster reaction
-        self.df['MA10'] = self.df['close'].ewm(span=10, adjust=False).mean()
-        self.df['MA20'] = self.df['close'].ewm(span=20, adjust=False).mean()
-        self.df['MA50'] = self.df['close'].ewm(span=50, adjust=False).mean()
+        close = np.ascontiguousarray(self._src['close'].to_numpy(dtype=np.float64))
+        key = _close_key(close)
+        
+        with _IND_CACHE_LOCK:
+            cached = _IND_CACHE.get(key)
+            if cached is not None:
+                _IND_CACHE.move_to_end(key)
+        
+        if cached is None:
+            close_series = pd.Series(close)
+            cached = _indicator_buffer([
+                close_series.ewm(span=span, adjust=False).mean().to_numpy()
+                for span in (10, 20, 50)
+            ])
+            cached.setflags(write=False)
+            
+            with _IND_CACHE_LOCK:
+                _IND_CACHE[key] = cached
+                if len(_IND_CACHE) > _IND_CACHE_SIZE:
+                    _IND_CACHE.popitem(last=False)
+        
+        self._ind = cached
     
     def get_analysis(self):
         """
@@ -52,7 +195,7 @@ class TechnicalAnalyzer:
                 'component_score': float
             }
         """
-        if self.df is None or len(self.df) < 50:
+        if self._n < MIN_HISTORY_BARS:
             return {
                 'status': 'NA',
                 'signal': 'HOLD',
@@ -71,16 +214,7 @@ class TechnicalAnalyzer:
         
         # Simple status mapping from MA score
         ma_score = ma_result.get('score', 0)
-        if ma_score >= 9:
-            overall_status = 'EXCELLENT'
-        elif ma_score >= 7:
-            overall_status = 'GOOD'
-        elif ma_score >= 4:
-            overall_status = 'ACCEPTABLE'
-        elif ma_score >= 2:
-            overall_status = 'WARNING'
-        else:
-            overall_status = 'POOR'
+        overall_status = score_to_status(ma_score)
         
         # Determine signal from MA forecast
         forecast_scenario = ma_result.get('forecast', {}).get('scenario', {}).get('scenario', 'SIDEWAY')
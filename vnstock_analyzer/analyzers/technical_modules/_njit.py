@@ -0,0 +1,140 @@
+"""
+Numba helpers - Compiled indicator kernels (optional numba)
+
+Nếu có numba: kernels được JIT-compile (nopython, cache=True).
+Nếu không: cùng code chạy như Python thuần - kết quả giống hệt.
+
+Pure functions over NumPy arrays - no pandas.
+"""
+
+import numpy as np
+
+# numba is optional - fall back to a no-op decorator and plain range
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+
+@njit(cache=True)
+def _ema_njit(close, span):
+    """
+    EMA một lượt - giống hệt pandas ewm(span=span, adjust=False).mean()
+
+    NaN handling matches pandas (ignore_na=False): leading NaN stay NaN,
+    gaps keep the last value and decay its weight.
+
+    Args:
+        close: 1-D float64 array
+        span: EMA span (alpha = 2 / (span + 1))
+
+    Returns:
+        np.ndarray: EMA values (float64, same length as close)
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+
+    alpha = 2.0 / (span + 1.0)
+    old_wt_factor = 1.0 - alpha
+
+    weighted = close[0]
+    nobs = 1 if weighted == weighted else 0
+    out[0] = weighted if nobs > 0 else np.nan
+    old_wt = 1.0
+
+    for i in range(1, n):
+        cur = close[i]
+        is_obs = cur == cur
+        if is_obs:
+            nobs += 1
+
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_obs:
+            weighted = cur
+
+        out[i] = weighted if nobs > 0 else np.nan
+
+    return out
+
+
+@njit(cache=True)
+def _ema3_njit(close, span1, span2, span3):
+    """
+    Ba EMA trong một lượt duyệt close (fused _ema_njit x3)
+
+    Args:
+        close: 1-D float64 array
+        span1, span2, span3: EMA spans (e.g. 10, 20, 50)
+
+    Returns:
+        tuple: (ema1, ema2, ema3) float64 arrays, each identical to _ema_njit
+    """
+    n = close.shape[0]
+    out1 = np.empty(n, dtype=np.float64)
+    out2 = np.empty(n, dtype=np.float64)
+    out3 = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out1, out2, out3
+
+    a1 = 2.0 / (span1 + 1.0)
+    a2 = 2.0 / (span2 + 1.0)
+    a3 = 2.0 / (span3 + 1.0)
+    f1 = 1.0 - a1
+    f2 = 1.0 - a2
+    f3 = 1.0 - a3
+
+    w1 = w2 = w3 = close[0]
+    nobs = 1 if w1 == w1 else 0
+    first = w1 if nobs > 0 else np.nan
+    out1[0] = first
+    out2[0] = first
+    out3[0] = first
+    ow1 = ow2 = ow3 = 1.0
+
+    for i in range(1, n):
+        cur = close[i]
+        is_obs = cur == cur
+        if is_obs:
+            nobs += 1
+
+        # All three EMAs share the same NaN state - only the weights differ
+        if w1 == w1:
+            ow1 *= f1
+            ow2 *= f2
+            ow3 *= f3
+            if is_obs:
+                if w1 != cur:
+                    w1 = (ow1 * w1 + a1 * cur) / (ow1 + a1)
+                if w2 != cur:
+                    w2 = (ow2 * w2 + a2 * cur) / (ow2 + a2)
+                if w3 != cur:
+                    w3 = (ow3 * w3 + a3 * cur) / (ow3 + a3)
+                ow1 = ow2 = ow3 = 1.0
+        elif is_obs:
+            w1 = w2 = w3 = cur
+
+        if nobs > 0:
+            out1[i] = w1
+            out2[i] = w2
+            out3[i] = w3
+        else:
+            out1[i] = out2[i] = out3[i] = np.nan
+
+    return out1, out2, out3
+
@@ -0,0 +1,75 @@
+"""
+Batch indicators - Tính MA cho nhiều mã cùng lúc trên mảng 2D (symbols x time)
+
+Histories có độ dài khác nhau được pad NaN ở đầu: EMA bỏ qua NaN đầu chuỗi,
+nên kết quả của mỗi dòng giống hệt khi tính riêng từng mã.
+
+Pure functions - no side effects.
+"""
+
+import numpy as np
+
+from ._njit import njit, prange, _ema3_njit
+
+
+@njit(parallel=True, cache=True)
+def _ema3_rows(close2d, span1, span2, span3):
+    """
+    Fused EMA x3 for every row of a 2D close array (rows run in parallel)
+    
+    Args:
+        close2d: (K, T) float64 array, one symbol per row
+        span1, span2, span3: EMA spans
+        
+    Returns:
+        tuple: three (K, T) float64 arrays
+    """
+    k_rows, t_cols = close2d.shape
+    out1 = np.empty((k_rows, t_cols), dtype=np.float64)
+    out2 = np.empty((k_rows, t_cols), dtype=np.float64)
+    out3 = np.empty((k_rows, t_cols), dtype=np.float64)
+    
+    for k in prange(k_rows):
+        ema1, ema2, ema3 = _ema3_njit(close2d[k], span1, span2, span3)
+        out1[k, :] = ema1
+        out2[k, :] = ema2
+        out3[k, :] = ema3
+    
+    return out1, out2, out3
+
+
+def stack_closes(closes):
+    """
+    Stack 1-D close arrays into one (K, T) float64 array, front-padded with NaN
+    
+    Args:
+        closes: List of 1-D close arrays (different lengths allowed)
+        
+    Returns:
+        np.ndarray: (K, T) array where T = longest history
+    """
+    t_cols = max((len(c) for c in closes), default=0)
+    close2d = np.full((len(closes), t_cols), np.nan, dtype=np.float64)
+    for k, close in enumerate(closes):
+        if len(close):
+            close2d[k, t_cols - len(close):] = close
+    return close2d
+
+
+def compute_indicators_batch(close2d):
+    """
+    Compute MA10/MA20/MA50 (EMA) for many symbols at once
+    
+    Args:
+        close2d: (K, T) close array, one symbol per row (leading NaN = padding)
+        
+    Returns:
+        dict: {'MA10': (K, T) float64, 'MA20': ..., 'MA50': ...}
+    """
+    close2d = np.ascontiguousarray(close2d, dtype=np.float64)
+    ma10, ma20, ma50 = _ema3_rows(close2d, 10, 20, 50)
+    return {
+        'MA10': ma10,
+        'MA20': ma20,
+        'MA50': ma50
+    }
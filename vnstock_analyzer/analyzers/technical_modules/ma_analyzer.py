@@ -9,18 +9,109 @@ Import pure functions from modules:
 Uses EMA (Exponential Moving Average) to match TradingView default.
 """
 
+import bisect
+import math
+from types import MappingProxyType
+
+import numpy as np
+
 from .ma_detector import (
     detect_convergence,
     detect_expansion,
     detect_golden_cross,
     detect_death_cross,
-    detect_tight_convergence
+    detect_tight_convergence,
+    ma_tail,
+    close_tail
 )
 from .ma_momentum import analyze_momentum
-from .ma_signal_formatter import format_ma_signals
 from .ma_column_formatter import format_ma_columns
 
 
+# Score (0-10) -> status: score >= threshold[i] moves up one label
+STATUS_THRESHOLDS = (2, 4, 7, 9)
+STATUS_LABELS = ('POOR', 'WARNING', 'ACCEPTABLE', 'GOOD', 'EXCELLENT')
+
+# Shared read-only fallback for missing nested results (no per-call {} allocation)
+_EMPTY_DICT = MappingProxyType({})
+
+# Death cross severity -> score penalty (LOW/unknown: no penalty)
+SEVERITY_PENALTY = {
+    'CRITICAL': 5,
+    'HIGH': 3,
+    'MEDIUM': 1
+}
+
+# Perfect Order + expansion quality -> score (other qualities: 3)
+EXPANSION_SCORE = {
+    'PERFECT': 6,
+    'GOOD': 5
+}
+
+# Fixed reason strings (shared module constants, not rebuilt per call)
+_R_NO_DATA = 'Không đủ dữ liệu'
+_R_BAD_MA = 'Dữ liệu MA không hợp lệ'
+_R_PERFECT_NO_FAN = "✅ Perfect Order nhưng MA chưa xoè rõ"
+_R_SHORT_BULLISH = "➕ MA ngắn hạn tích cực (MA10>MA20)"
+_R_NO_PERFECT = "⚠️ Chưa có Perfect Order"
+_R_BELOW_MA10 = "❌ Giá dưới MA10"
+
+# MA order state: 2 = Perfect Order, 1 = only MA10 > MA20, 0 = neither
+# States 0/1 -> fixed score + reason; state 2 depends on expansion quality
+_ORDER_STATE_SCORE = (0, 2)
+_ORDER_STATE_REASONS = (_R_NO_PERFECT, _R_SHORT_BULLISH)
+
+# Reason tokens (key, *args) -> template; formatted only by render_reasons()
+REASON_TEMPLATES = {
+    'price_above_ma50': "✅ Giá trên MA50 (+{:.1f}%)",
+    'price_above_ma20': "➕ Giá trên MA20 (+{:.1f}%)",
+    'price_above_ma10': "⚠️ Giá chỉ trên MA10 (+{:.1f}%)",
+    'death_cross': "⚠️ Death Cross: {} (Mức độ: {})"
+}
+
+
+def score_to_status(score):
+    """
+    Map a 0-10 score to its status label
+    
+    Args:
+        score: float (0-10)
+        
+    Returns:
+        str: EXCELLENT/GOOD/ACCEPTABLE/WARNING/POOR
+    """
+    if score != score:  # NaN -> POOR (like the old if-ladder)
+        return STATUS_LABELS[0]
+    return STATUS_LABELS[bisect.bisect_right(STATUS_THRESHOLDS, score)]
+
+
+def render_reasons(reasons):
+    """
+    Format reason tokens into display strings
+    
+    Args:
+        reasons: list of str (already final) or tuple (key, *args) -> REASON_TEMPLATES
+        
+    Returns:
+        list: str reasons
+    """
+    return [
+        reason if isinstance(reason, str) else REASON_TEMPLATES[reason[0]].format(*reason[1:])
+        for reason in reasons
+    ]
+
+
+def _na_result(reason):
+    """NA result (not enough / unusable MA data) - same shape for every early exit"""
+    return {
+        'score': 0,
+        'status': 'NA',
+        'reasons': [reason],
+        'details': {},
+        'ma_signals': []
+    }
+
+
 class MAAnalyzer:
     """
     Main orchestrator for MA analysis - Simplified to ~200 lines
@@ -33,6 +124,9 @@ class MAAnalyzer:
     - Sell Warnings (cảnh báo bán sớm)
     """
     
+    # One instance per ticker in bulk screens - no per-instance __dict__
+    __slots__ = ('df', '_n', '_last', '_result', '_result_key')
+    
     def __init__(self, df):
         """
         Args:
@@ -40,11 +134,78 @@ class MAAnalyzer:
             Note: Dùng EMA (Exponential MA) để match TradingView
         """
         self.df = df
+        self._n = 0 if df is None else df.shape[0]
+        self._last = None
+        self._result = None
+        self._result_key = None
+    
+    @staticmethod
+    def analyze_batch(dfs):
+        """
+        Analyze many tickers
+        
+        Runs in-process: analyze() only reads the last MA_TAIL bars (< 1 ms per
+        ticker), so shipping frames to worker processes costs far more than it saves.
+        
+        Args:
+            dfs: dict {symbol: DataFrame đã tính sẵn MA10/MA20/MA50}
+            
+        Returns:
+            dict: {symbol: analyze() result}
+        """
+        return {symbol: MAAnalyzer(df).analyze() for symbol, df in dfs.items()}
+    
+    @staticmethod
+    def snapshot_batch(dfs):
+        """
+        Perfect Order + price position for many tickers in one NumPy pass
+        
+        Last bars are stacked into an (N, 4) array - no detectors, no per-ticker
+        Python scoring. Same formulas as analyze()/_get_price_position().
+        
+        Args:
+            dfs: dict {symbol: DataFrame đã tính sẵn MA10/MA20/MA50}
+            
+        Returns:
+            dict: {
+                'symbols': list (row order of the arrays),
+                'perfect_order': (N,) bool array,
+                'vs_ma10', 'vs_ma20', 'vs_ma50': (N,) float64 arrays (%)
+            }
+        """
+        symbols = list(dfs)
+        last = np.array(
+            [[df[col].iat[-1] for col in ('close', 'MA10', 'MA20', 'MA50')] for df in dfs.values()],
+            dtype=np.float64
+        ).reshape(-1, 4)
+        close = last[:, :1]
+        mas = last[:, 1:]
+        
+        perfect_order = (mas[:, 0] > mas[:, 1]) & (mas[:, 1] > mas[:, 2])
+        
+        # Zero where MA <= 0, and all three zero when MA50 <= 0 (like _get_price_position)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dists = np.where(mas > 0, (close - mas) / mas * 100, 0.0)
+        dists[~(mas[:, 2] > 0)] = 0.0
+        
+        return {
+            'symbols': symbols,
+            'perfect_order': perfect_order,
+            'vs_ma10': dists[:, 0],
+            'vs_ma20': dists[:, 1],
+            'vs_ma50': dists[:, 2]
+        }
     
-    def analyze(self):
+    def analyze(self, skip_tooltips=False, raw_reasons=False):
         """
         Main analysis flow - Orchestrates all modules
         
+        Args:
+            skip_tooltips: True -> columns keep their tooltip key but as ''
+                (screeners that only rank by score skip the HTML formatting)
+            raw_reasons: True -> numeric reasons stay as (key, value...) tokens;
+                render_reasons() formats them for the tickers actually shown
+        
         Flow:
         1. Run all detectors (convergence, expansion, golden_cross, death_cross, tight_convergence)
         2. Run momentum analysis
@@ -60,29 +221,49 @@ class MAAnalyzer:
                 'ma_signals': list (factual signals only - NO advice)
             }
         """
-        if self.df is None or len(self.df) < 50:
-            return {
-                'score': 0,
-                'status': 'NA',
-                'reasons': ['Không đủ dữ liệu'],
-                'details': {},
-                'ma_signals': []
-            }
+        # Row count re-read each call: bars may have been appended since __init__
+        self._n = 0 if self.df is None else self.df.shape[0]
+        if self._n < 50:
+            return _na_result(_R_NO_DATA)
         
-        # === 1. RUN ALL DETECTORS ===
-        expansion = detect_expansion(self.df)
+        # Same bars as the previous call -> reuse its result
+        result_key = (self._n, self.df.index[-1], skip_tooltips, raw_reasons)
+        if self._result is not None and result_key == self._result_key:
+            return self._result
+        
+        # Recomputing -> drop the last-bar snapshot too (re-read from the new tails below)
+        self._last = None
+        
+        # MA/close tails extracted once, shared by every detector
+        ma_arr = ma_tail(self.df)
+        close_arr = close_tail(self.df)
+        
+        # Perfect Order computed once - shared by detectors + scoring
+        latest = self._last_bar(ma_arr, close_arr)
+        
+        # NaN/inf or non-positive MA on the last bar -> NA before running any detector
+        if (not all(math.isfinite(v) for v in latest.values())
+                or min(latest['MA10'], latest['MA20'], latest['MA50']) <= 0):
+            return _na_result(_R_BAD_MA)
         
-        # Check Perfect Order first (needed for convergence logic)
-        latest = self.df.iloc[-1]
         perfect_order = (latest['MA10'] > latest['MA20'] > latest['MA50'])
         
-        convergence = detect_convergence(self.df, perfect_order=perfect_order)
-        golden_cross = detect_golden_cross(self.df)
-        death_cross = detect_death_cross(self.df)
-        tight_convergence = detect_tight_convergence(self.df, convergence, death_cross)
+        # === 1. RUN ALL DETECTORS ===
+        expansion = detect_expansion(self.df, ma_arr=ma_arr, perfect_order=perfect_order)
+        convergence = detect_convergence(self.df, perfect_order=perfect_order, ma_arr=ma_arr)
+        golden_cross = detect_golden_cross(self.df, ma_arr=ma_arr)
+        death_cross = detect_death_cross(
+            self.df, ma_arr=ma_arr, close_arr=close_arr,
+            perfect_order=perfect_order
+        )
+        tight_convergence = detect_tight_convergence(
+            self.df, convergence, death_cross,
+            ma_arr=ma_arr, close_arr=close_arr,
+            perfect_order=perfect_order
+        )
         
         # === 2. RUN MOMENTUM ANALYSIS ===
-        momentum = analyze_momentum(self.df)
+        momentum = analyze_momentum(self.df, ma_arr=ma_arr)
         
         # === 3. FORMAT UI COLUMNS (NEW STRUCTURE) ===
         price_position = self._get_price_position()
@@ -93,20 +274,28 @@ class MAAnalyzer:
             convergence=convergence,  # Always pass (formatter will decide)
             golden_cross=golden_cross if golden_cross.get('best_cross') else None,
             death_cross=death_cross if death_cross.get('has_death_cross') else None,
-            tight_convergence=tight_convergence if tight_convergence.get('is_tight') else None
+            tight_convergence=tight_convergence if tight_convergence.get('is_tight') else None,
+            skip_tooltips=skip_tooltips
         )
         
         # === 4. CALCULATE SCORE ===
         score, status, reasons = self._calculate_score(
             expansion, convergence, golden_cross,
-            death_cross, tight_convergence, momentum
+            death_cross, tight_convergence, momentum,
+            perfect_order=perfect_order,
+            price_position=price_position
         )
+        if not raw_reasons:
+            reasons = render_reasons(reasons)
         
         # === 5. RETURN FLATTENED STRUCTURE (matching ma_result_new.json) ===
-        latest = self.df.iloc[-1]
-        perfect_order = (latest['MA10'] > latest['MA20'] > latest['MA50'])
+        price_below_ma = death_cross.get('price_below_ma') or _EMPTY_DICT
+        ma10_momentum = momentum.get('ma10') or _EMPTY_DICT
+        ma20_momentum = momentum.get('ma20') or _EMPTY_DICT
+        ma50_momentum = momentum.get('ma50') or _EMPTY_DICT
         
-        return {
+        self._result_key = result_key
+        self._result = {
             'score': score,
             'status': status,
             'reasons': reasons,
@@ -136,25 +325,25 @@ class MAAnalyzer:
             'death_cross': {
                 'has_cross': death_cross.get('has_death_cross', False),
                 'crosses': death_cross.get('crosses', []),
-                'price_below_ma10': death_cross.get('price_below_ma', {}).get('ma10', False),
-                'price_below_ma20': death_cross.get('price_below_ma', {}).get('ma20', False),
-                'price_below_ma50': death_cross.get('price_below_ma', {}).get('ma50', False)
+                'price_below_ma10': price_below_ma.get('below_ma10', False),
+                'price_below_ma20': price_below_ma.get('below_ma20', False),
+                'price_below_ma50': price_below_ma.get('below_ma50', False)
             },
             'momentum': {
                 'ma10': {
-                    'slope': round(momentum.get('ma10', {}).get('slope', 0), 2),
-                    'trend': momentum.get('ma10', {}).get('trend'),
-                    'strength': momentum.get('ma10', {}).get('strength')
+                    'slope': round(ma10_momentum.get('slope', 0), 2),
+                    'trend': ma10_momentum.get('trend'),
+                    'strength': ma10_momentum.get('strength')
                 },
                 'ma20': {
-                    'slope': round(momentum.get('ma20', {}).get('slope', 0), 2),
-                    'trend': momentum.get('ma20', {}).get('trend'),
-                    'strength': momentum.get('ma20', {}).get('strength')
+                    'slope': round(ma20_momentum.get('slope', 0), 2),
+                    'trend': ma20_momentum.get('trend'),
+                    'strength': ma20_momentum.get('strength')
                 },
                 'ma50': {
-                    'slope': round(momentum.get('ma50', {}).get('slope', 0), 2),
-                    'trend': momentum.get('ma50', {}).get('trend'),
-                    'strength': momentum.get('ma50', {}).get('strength')
+                    'slope': round(ma50_momentum.get('slope', 0), 2),
+                    'trend': ma50_momentum.get('trend'),
+                    'strength': ma50_momentum.get('strength')
                 },
                 'alignment': momentum.get('alignment'),
                 'summary': momentum.get('summary')
@@ -168,9 +357,39 @@ class MAAnalyzer:
             # UI-ready columns
             'columns': columns
         }
+        
+        return self._result
+    
+    def _last_bar(self, ma_arr=None, close_arr=None):
+        """
+        Last-bar values as plain floats (read once, no row Series per access)
+        
+        Args:
+            ma_arr: Optional ma_tail(df) array - last row read from it (no pandas access)
+            close_arr: Optional close_tail(df) array (used together with ma_arr)
+        
+        Returns:
+            dict: {'close': float, 'MA10': float, 'MA20': float, 'MA50': float}
+        """
+        if self._last is None:
+            if ma_arr is not None and close_arr is not None:
+                ma10, ma20, ma50 = ma_arr[-1].tolist()
+                self._last = {
+                    'close': float(close_arr[-1]),
+                    'MA10': ma10,
+                    'MA20': ma20,
+                    'MA50': ma50
+                }
+            else:
+                self._last = {
+                    col: float(self.df[col].iat[-1])
+                    for col in ('close', 'MA10', 'MA20', 'MA50')
+                }
+        return self._last
     
     def _calculate_score(self, expansion, convergence, golden_cross,
-                         death_cross, tight_convergence, momentum):
+                         death_cross, tight_convergence, momentum,
+                         perfect_order=None, price_position=None):
         """
         Calculate score from all signals
         
@@ -181,63 +400,55 @@ class MAAnalyzer:
             death_cross: Result from detect_death_cross()
             tight_convergence: Result from detect_tight_convergence()
             momentum: Result from analyze_momentum()
+            perfect_order: MA10 > MA20 > MA50 (computed here if None)
+            price_position: Result from _get_price_position() (computed here if None)
             
         Returns:
-            tuple: (score, status, reasons)
+            tuple: (score, status, reasons) - reasons as str / REASON_TEMPLATES tokens
         """
-        latest = self.df.iloc[-1]
+        latest = self._last_bar()
         price = latest['close']
+        
+        if perfect_order is None:
+            perfect_order = (latest['MA10'] > latest['MA20'] > latest['MA50'])
+        order_state = 2 if perfect_order else int(latest['MA10'] > latest['MA20'])
+        if price_position is None:
+            price_position = self._get_price_position()
+        
         score = 0
         reasons = []
         
         # === 1. PERFECT ORDER & MA EXPANSION ===
-        perfect_order = (latest['MA10'] > latest['MA20'] > latest['MA50'])
-        
-        if perfect_order:
-            if expansion['expansion_quality'] == 'PERFECT':
-                score += 6
-                reasons.append(expansion['message'])
-            elif expansion['expansion_quality'] == 'GOOD':
-                score += 5
-                reasons.append(expansion['message'])
-            else:
-                score += 3
-                reasons.append("✅ Perfect Order nhưng MA chưa xoè rõ")
-        elif (latest['MA10'] > latest['MA20']):
-            score += 2
-            reasons.append("➕ MA ngắn hạn tích cực (MA10>MA20)")
+        if order_state == 2:
+            quality = expansion['expansion_quality']
+            score += EXPANSION_SCORE.get(quality, 3)
+            reasons.append(expansion['message'] if quality in EXPANSION_SCORE else _R_PERFECT_NO_FAN)
         else:
-            reasons.append("⚠️ Chưa có Perfect Order")
+            score += _ORDER_STATE_SCORE[order_state]
+            reasons.append(_ORDER_STATE_REASONS[order_state])
         
         # === 2. VỊ TRÍ GIÁ SO VỚI MA ===
-        price_position = self._get_price_position()
-        dist_to_ma50 = price_position.get('vs_ma50', 0)
-        dist_to_ma20 = price_position.get('vs_ma20', 0)
-        dist_to_ma10 = price_position.get('vs_ma10', 0)
-        
         if price > latest['MA50']:
             score += 2
-            reasons.append(f"✅ Giá trên MA50 (+{dist_to_ma50:.1f}%)")
+            reasons.append(('price_above_ma50', price_position.get('vs_ma50', 0)))
         elif price > latest['MA20']:
             score += 1
-            reasons.append(f"➕ Giá trên MA20 (+{dist_to_ma20:.1f}%)")
+            reasons.append(('price_above_ma20', price_position.get('vs_ma20', 0)))
         elif price > latest['MA10']:
             score += 0.5
-            reasons.append(f"⚠️ Giá chỉ trên MA10 (+{dist_to_ma10:.1f}%)")
+            reasons.append(('price_above_ma10', price_position.get('vs_ma10', 0)))
         else:
-            reasons.append("❌ Giá dưới MA10")
+            reasons.append(_R_BELOW_MA10)
         
         # === 3. GOLDEN CROSS ===
         if golden_cross['best_cross']:
-            best = golden_cross['best_cross']
-            score += best['score'] * 0.3
+            score += golden_cross['best_cross']['score'] * 0.3
             reasons.append(golden_cross['message'])
         
         # === 4. MA CONVERGENCE ===
-        if convergence['is_converging'] and convergence['convergence_strength'] > 70:
-            score += 1
-            reasons.append(convergence['message'])
-        elif convergence['is_converging']:
+        if convergence['is_converging']:
+            if convergence['convergence_strength'] > 70:
+                score += 1
             reasons.append(convergence['message'])
         
         # === 5. TIGHT CONVERGENCE (MA siêu xoắn) ===
@@ -248,19 +459,12 @@ class MAAnalyzer:
         # === 6. DEATH CROSS (Factual - not advice) ===
         if death_cross['has_death_cross']:
             # Giảm điểm nếu có death cross
-            strongest = death_cross.get('strongest_cross', {})
+            strongest = death_cross.get('strongest_cross') or _EMPTY_DICT
             severity = strongest.get('severity', 'LOW')
-            
-            if severity == 'CRITICAL':
-                score = max(0, score - 5)
-            elif severity == 'HIGH':
-                score = max(0, score - 3)
-            elif severity == 'MEDIUM':
-                score = max(0, score - 1)
+            score = max(0, score - SEVERITY_PENALTY.get(severity, 0))
             
             # Thêm thông tin factual vào reasons (NO advice)
-            cross_type = strongest.get('type', '')
-            reasons.append(f"⚠️ Death Cross: {cross_type} (Mức độ: {severity})")
+            reasons.append(('death_cross', strongest.get('type', ''), severity))
         
         # === 7. MOMENTUM SUMMARY ===
         if momentum['alignment'] in ['BULLISH_ALIGNED', 'MOSTLY_BULLISH']:
@@ -268,17 +472,7 @@ class MAAnalyzer:
         
         # === 8. FINALIZE SCORE & STATUS ===
         final_score = min(score, 10)
-        
-        if final_score >= 9:
-            status = 'EXCELLENT'
-        elif final_score >= 7:
-            status = 'GOOD'
-        elif final_score >= 4:
-            status = 'ACCEPTABLE'
-        elif final_score >= 2:
-            status = 'WARNING'
-        else:
-            status = 'POOR'
+        status = score_to_status(final_score)
         
         return final_score, status, reasons
     
@@ -293,7 +487,7 @@ class MAAnalyzer:
                 'vs_ma10': float
             }
         """
-        latest = self.df.iloc[-1]
+        latest = self._last_bar()
         price = latest['close']
         ma50 = latest['MA50']
         ma20 = latest['MA20']
@@ -6,7 +6,34 @@ Each column has: type, icon, color, label, value, tooltip
 """
 
 
-def format_ma_columns(expansion, momentum, price_position, convergence=None, golden_cross=None, death_cross=None, tight_convergence=None):
+# Expansion quality -> color
+EXPANSION_COLORS = {
+    'PERFECT': 'success',
+    'GOOD': 'light-green',
+    'WEAK': 'warning',
+    'CONTRACTING': 'error'
+}
+
+# Momentum alignment -> color
+ALIGNMENT_COLORS = {
+    'BULLISH_ALIGNED': 'success',
+    'MOSTLY_BULLISH': 'light-green',
+    'NEUTRAL': 'warning',
+    'MOSTLY_BEARISH': 'orange',
+    'BEARISH_ALIGNED': 'error'
+}
+
+# (price > MA50, price > MA20) -> (color, icon): xanh nếu trên MA50, vàng nếu trên MA20, đỏ nếu dưới
+POSITION_UI = {
+    (True, True): ('blue', 'mdi-arrow-up'),
+    (True, False): ('blue', 'mdi-arrow-up'),
+    (False, True): ('cyan', 'mdi-arrow-bottom-left'),
+    (False, False): ('orange', 'mdi-arrow-down')
+}
+
+
+def format_ma_columns(expansion, momentum, price_position, convergence=None, golden_cross=None, death_cross=None, tight_convergence=None,
+                      skip_tooltips=False):
     """
     Format MA analysis into table columns
     
@@ -18,6 +45,7 @@ def format_ma_columns(expansion, momentum, price_position, convergence=None, gol
         golden_cross: Optional - Result from detect_golden_cross()
         death_cross: Optional - Result from detect_death_cross()
         tight_convergence: Optional - Result from detect_tight_convergence()
+        skip_tooltips: True -> tooltip = '' (screener paths that never render HTML)
         price_position: Price position dict {vs_ma10, vs_ma20, vs_ma50}
         convergence: Optional - Result from detect_convergence()
         golden_cross: Optional - Result from detect_golden_cross()
@@ -35,21 +63,13 @@ def format_ma_columns(expansion, momentum, price_position, convergence=None, gol
         ma20_dist = expansion.get('ma20_ma50_distance', 0)
         ma50_slope = expansion.get('ma50_slope', 0)
         
-        # Color based on quality
-        color_map = {
-            'PERFECT': 'success',
-            'GOOD': 'light-green',
-            'WEAK': 'warning',
-            'CONTRACTING': 'error'
-        }
-        
         columns.append({
             'type': 'expansion',
             'icon': 'mdi-arrow-expand-all',
-            'color': color_map.get(quality, 'grey'),
+            'color': EXPANSION_COLORS.get(quality, 'grey'),
             'label': f'MA xoè ({quality})',
             'value': quality,
-            'tooltip': (
+            'tooltip': '' if skip_tooltips else (
                 f"<strong>🚀 MA Expansion</strong><br>"
                 f"Chất lượng: {quality}<br>"
                 f"MA10 cách MA50: +{ma10_dist:.1f}%<br>"
@@ -65,22 +85,13 @@ def format_ma_columns(expansion, momentum, price_position, convergence=None, gol
         ma50_slope = momentum.get('ma50', {}).get('slope', 0)
         alignment = momentum.get('alignment', 'NEUTRAL')
         
-        # Color based on alignment
-        color_map = {
-            'BULLISH_ALIGNED': 'success',
-            'MOSTLY_BULLISH': 'light-green',
-            'NEUTRAL': 'warning',
-            'MOSTLY_BEARISH': 'orange',
-            'BEARISH_ALIGNED': 'error'
-        }
-        
         columns.append({
             'type': 'momentum',
             'icon': 'mdi-speedometer',
-            'color': color_map.get(alignment, 'grey'),
+            'color': ALIGNMENT_COLORS.get(alignment, 'grey'),
             'label': f'Momentum {alignment}',
             'value': alignment,
-            'tooltip': (
+            'tooltip': '' if skip_tooltips else (
                 f"<strong>📊 Momentum (%/ngày)</strong><br>"
                 f"MA10: {ma10_slope:+.2f}<br>"
                 f"MA20: {ma20_slope:+.2f}<br>"
@@ -99,15 +110,7 @@ def format_ma_columns(expansion, momentum, price_position, convergence=None, gol
         label = f"Giá vs MA50: {vs_ma50:+.1f}%"
         
         # Color: xanh nếu trên MA50, vàng nếu trên MA20, đỏ nếu dưới
-        if vs_ma50 > 0:
-            color = 'blue'
-            icon = 'mdi-arrow-up'
-        elif vs_ma20 > 0:
-            color = 'cyan'
-            icon = 'mdi-arrow-bottom-left'
-        else:
-            color = 'orange'
-            icon = 'mdi-arrow-down'
+        color, icon = POSITION_UI[(bool(vs_ma50 > 0), bool(vs_ma20 > 0))]
         
         columns.append({
             'type': 'price_position',
@@ -115,7 +118,7 @@ def format_ma_columns(expansion, momentum, price_position, convergence=None, gol
             'color': color,
             'label': label,
             'value': f"{vs_ma50:+.1f}%",
-            'tooltip': (
+            'tooltip': '' if skip_tooltips else (
                 f"<strong>📍 Vị trí giá</strong><br>"
                 f"vs MA10: {vs_ma10:+.1f}%<br>"
                 f"vs MA20: {vs_ma20:+.1f}%<br>"
@@ -148,7 +151,7 @@ def format_ma_columns(expansion, momentum, price_position, convergence=None, gol
                 'color': color,
                 'label': f'MA hội tụ ({strength:.0f}%)',
                 'value': f"{strength:.0f}%",
-                'tooltip': (
+                'tooltip': '' if skip_tooltips else (
                     f"<strong>⚡ MA Convergence</strong><br>"
                     f"Độ mạnh: {strength:.0f}%<br>"
                     f"Khoảng cách TB: {avg_dist:.2f}%<br>"
@@ -172,7 +175,7 @@ def format_ma_columns(expansion, momentum, price_position, convergence=None, gol
             'color': color,
             'label': f'MA SIÊU XOẮN ({strength:.0f}%)',
             'value': f"{strength:.0f}%",
-            'tooltip': (
+            'tooltip': '' if skip_tooltips else (
                 f"<strong>⚡⚡ TIGHT CONVERGENCE - BREAKOUT SẮP XẢY RA!</strong><br>"
                 f"Độ mạnh: {strength:.0f}%<br>"
                 f"Khoảng cách TB: {avg_dist:.2f}%<br>"
@@ -190,7 +193,7 @@ def format_ma_columns(expansion, momentum, price_position, convergence=None, gol
             'color': 'amber',
             'label': cross.get('label', 'Golden Cross'),
             'value': f"{cross.get('score', 0)}/10",
-            'tooltip': (
+            'tooltip': '' if skip_tooltips else (
                 f"<strong>⭐ {cross.get('label')}</strong><br>"
                 f"Loại: {cross.get('type')}<br>"
                 f"Độ uy tín: {cross.get('score')}/10<br>"
@@ -208,7 +211,7 @@ def format_ma_columns(expansion, momentum, price_position, convergence=None, gol
             'color': 'error',
             'label': f'Death Cross ({severity})',
             'value': severity,
-            'tooltip': (
+            'tooltip': '' if skip_tooltips else (
                 f"<strong>⚠️ Death Cross</strong><br>"
                 f"Loại: {dc.get('type')}<br>"
                 f"Mức độ: {severity}<br>"
@@ -11,14 +11,51 @@ Phát hiện các patterns trong Moving Averages:
 All functions are PURE - no side effects, easy to test.
 """
 
+import numpy as np
 
-def detect_convergence(df, perfect_order=False):
+
+# Column order of ma_arr (shared by all detectors + momentum)
+MA_COLUMNS = ('MA10', 'MA20', 'MA50')
+# Bars kept in ma_arr/close_arr - longest lookback is MA50 momentum (20 days)
+MA_TAIL = 20
+
+
+def ma_tail(df, tail=MA_TAIL):
+    """
+    Last bars of MA10/MA20/MA50 as one small array (built once, shared by detectors)
+    
+    Args:
+        df: DataFrame with MA10, MA20, MA50 columns
+        tail: Number of trailing bars
+        
+    Returns:
+        np.ndarray: (tail, 3) float64, columns in MA_COLUMNS order
+    """
+    return np.column_stack([df[col].to_numpy(dtype=np.float64)[-tail:] for col in MA_COLUMNS])
+
+
+def close_tail(df, tail=MA_TAIL):
+    """
+    Last bars of close as float64 array
+    
+    Args:
+        df: DataFrame with close column
+        tail: Number of trailing bars
+        
+    Returns:
+        np.ndarray: (tail,) float64
+    """
+    return df['close'].to_numpy(dtype=np.float64)[-tail:]
+
+
+def detect_convergence(df, perfect_order=False, ma_arr=None):
     """
     Phát hiện MA convergence (các đường MA xoắn vào nhau) - Dấu hiệu tích luỹ
     
     Args:
         df: DataFrame with MA10, MA20, MA50 columns
         perfect_order: bool - Có Perfect Order không? (MA10 > MA20 > MA50)
+        ma_arr: Optional ma_tail(df) array (built here if None)
         
     Returns:
         dict: {
@@ -36,12 +73,11 @@ def detect_convergence(df, perfect_order=False):
             'message': 'Không đủ dữ liệu'
         }
     
-    latest = df.iloc[-1]
+    if ma_arr is None:
+        ma_arr = ma_tail(df)
     
     # Tính khoảng cách % giữa các MA (KHÔNG dùng MA5 - quá nhạy)
-    ma10 = latest['MA10']
-    ma20 = latest['MA20']
-    ma50 = latest['MA50']
+    ma10, ma20, ma50 = ma_arr[-1]
     
     if ma50 == 0:
         return {
@@ -92,12 +128,14 @@ def detect_convergence(df, perfect_order=False):
     }
 
 
-def detect_expansion(df):
+def detect_expansion(df, ma_arr=None, perfect_order=None):
     """
     Phát hiện MA expansion (các đường MA xoè ra) - Xác nhận uptrend mạnh
     
     Args:
         df: DataFrame with MA10, MA20, MA50 columns
+        ma_arr: Optional ma_tail(df) array (built here if None)
+        perfect_order: Optional precomputed MA10 > MA20 > MA50 (computed here if None)
         
     Returns:
         dict: {
@@ -117,10 +155,13 @@ def detect_expansion(df):
             'message': 'Không đủ dữ liệu'
         }
     
-    latest = df.iloc[-1]
+    if ma_arr is None:
+        ma_arr = ma_tail(df)
+    ma10, ma20, ma50 = ma_arr[-1]
     
     # Kiểm tra Perfect Order (MA10 > MA20 > MA50, KHÔNG dùng MA5)
-    perfect_order = (latest['MA10'] > latest['MA20'] > latest['MA50'])
+    if perfect_order is None:
+        perfect_order = (ma10 > ma20 > ma50)
     
     if not perfect_order:
         return {
@@ -132,7 +173,6 @@ def detect_expansion(df):
         }
     
     # Tính khoảng cách giữa các MA (% so với MA50, KHÔNG dùng MA5)
-    ma50 = latest['MA50']
     if ma50 == 0:
         return {
             'is_expanding': False,
@@ -142,8 +182,8 @@ def detect_expansion(df):
             'message': 'MA50 = 0'
         }
     
-    dist_10_50 = (latest['MA10'] - ma50) / ma50 * 100
-    dist_20_50 = (latest['MA20'] - ma50) / ma50 * 100
+    dist_10_50 = (ma10 - ma50) / ma50 * 100
+    dist_20_50 = (ma20 - ma50) / ma50 * 100
     
     distances = {
         'ma10_ma50': dist_10_50,
@@ -152,7 +192,7 @@ def detect_expansion(df):
     
     # Tính độ nghiêng (slope) của MA50 trong 10 ngày gần nhất
     if len(df) >= 10:
-        ma50_10_days_ago = df.iloc[-10]['MA50']
+        ma50_10_days_ago = ma_arr[-10, 2]
         ma50_slope = ((ma50 - ma50_10_days_ago) / ma50_10_days_ago * 100) if ma50_10_days_ago > 0 else 0
     else:
         ma50_slope = 0
@@ -182,12 +222,13 @@ def detect_expansion(df):
     }
 
 
-def detect_golden_cross(df):
+def detect_golden_cross(df, ma_arr=None):
     """
     Phát hiện và đánh giá chất lượng Golden Cross (các mức độ uy tín khác nhau)
     
     Args:
         df: DataFrame with MA10, MA20, MA50 columns
+        ma_arr: Optional ma_tail(df) array (built here if None)
         
     Returns:
         dict: {
@@ -203,14 +244,17 @@ def detect_golden_cross(df):
             'message': 'Không đủ dữ liệu'
         }
     
+    if ma_arr is None:
+        ma_arr = ma_tail(df)
+    
     crosses = []
-    latest = df.iloc[-1]
+    ma10, ma20, ma50 = ma_arr[-1]
     
     if len(df) >= 2:
-        prev = df.iloc[-2]
+        prev_ma10, prev_ma20, prev_ma50 = ma_arr[-2]
         
         # MA10 x MA20 (Golden Cross ngắn hạn - 6 điểm)
-        if prev['MA10'] <= prev['MA20'] and latest['MA10'] > latest['MA20']:
+        if prev_ma10 <= prev_ma20 and ma10 > ma20:
             crosses.append({
                 'type': 'MA10_MA20',
                 'label': 'Golden Cross ngắn hạn',
@@ -219,7 +263,7 @@ def detect_golden_cross(df):
             })
         
         # MA20 x MA50 (Golden Cross UY TÍN - 10 điểm) - QUAN TRỌNG NHẤT
-        if prev['MA20'] <= prev['MA50'] and latest['MA20'] > latest['MA50']:
+        if prev_ma20 <= prev_ma50 and ma20 > ma50:
             crosses.append({
                 'type': 'MA20_MA50',
                 'label': 'Golden Cross UY TÍN',
@@ -245,7 +289,7 @@ def detect_golden_cross(df):
     }
 
 
-def detect_death_cross(df):
+def detect_death_cross(df, ma_arr=None, close_arr=None, perfect_order=None):
     """
     Phát hiện Death Cross - FACTUAL DATA ONLY, NO ADVICE
     
@@ -255,6 +299,9 @@ def detect_death_cross(df):
     
     Args:
         df: DataFrame with close, MA10, MA20, MA50 columns
+        ma_arr: Optional ma_tail(df) array (built here if None)
+        close_arr: Optional close_tail(df) array (built here if None)
+        perfect_order: Optional precomputed MA10 > MA20 > MA50 (computed here if None)
         
     Returns:
         dict: {
@@ -272,18 +319,25 @@ def detect_death_cross(df):
             'price_below_ma': {}
         }
     
-    latest = df.iloc[-1]
-    price = latest['close']
+    if ma_arr is None:
+        ma_arr = ma_tail(df)
+    if close_arr is None:
+        close_arr = close_tail(df)
+    
+    ma10, ma20, ma50 = ma_arr[-1]
+    price = close_arr[-1]
     crosses = []
     
     # Kiểm tra Perfect Order trước
-    was_in_perfect_order = (latest['MA10'] > latest['MA20'] > latest['MA50'])
+    if perfect_order is None:
+        perfect_order = (ma10 > ma20 > ma50)
+    was_in_perfect_order = perfect_order
     
     if len(df) >= 2:
-        prev = df.iloc[-2]
+        prev_ma10, prev_ma20, prev_ma50 = ma_arr[-2]
         
         # CRITICAL: MA20 cắt xuống MA50 (Death Cross uy tín)
-        if prev['MA20'] >= prev['MA50'] and latest['MA20'] < latest['MA50']:
+        if prev_ma20 >= prev_ma50 and ma20 < ma50:
             crosses.append({
                 'type': 'MA20_MA50',
                 'label': 'Death Cross MA20/MA50',
@@ -292,7 +346,7 @@ def detect_death_cross(df):
             })
         
         # HIGH: MA10 cắt xuống MA20 (Death Cross ngắn hạn)
-        elif prev['MA10'] >= prev['MA20'] and latest['MA10'] < latest['MA20']:
+        elif prev_ma10 >= prev_ma20 and ma10 < ma20:
             crosses.append({
                 'type': 'MA10_MA20',
                 'label': 'Death Cross MA10/MA20',
@@ -302,9 +356,9 @@ def detect_death_cross(df):
     
     # Check price breaking below MA
     price_below_ma = {
-        'below_ma10': price < latest['MA10'],
-        'below_ma20': price < latest['MA20'] and was_in_perfect_order,
-        'below_ma50': price < latest['MA50']
+        'below_ma10': price < ma10,
+        'below_ma20': price < ma20 and was_in_perfect_order,
+        'below_ma50': price < ma50
     }
     
     # Find strongest cross
@@ -322,7 +376,8 @@ def detect_death_cross(df):
     }
 
 
-def detect_tight_convergence(df, convergence, death_cross):
+def detect_tight_convergence(df, convergence, death_cross, ma_arr=None, close_arr=None,
+                             perfect_order=None):
     """
     Phát hiện MA SIÊU XOẮN - Dấu hiệu breakout sắp xảy ra
     
@@ -339,6 +394,9 @@ def detect_tight_convergence(df, convergence, death_cross):
         df: DataFrame with close, MA10, MA20, MA50
         convergence: Result from detect_convergence()
         death_cross: Result from detect_death_cross()
+        ma_arr: Optional ma_tail(df) array (built here if None)
+        close_arr: Optional close_tail(df) array (built here if None)
+        perfect_order: Optional precomputed MA10 > MA20 > MA50 (computed here if None)
         
     Returns:
         dict: {
@@ -355,11 +413,13 @@ def detect_tight_convergence(df, convergence, death_cross):
             'message': ''
         }
     
-    latest = df.iloc[-1]
-    price = latest['close']
-    ma10 = latest['MA10']
-    ma20 = latest['MA20']
-    ma50 = latest['MA50']
+    if ma_arr is None:
+        ma_arr = ma_tail(df)
+    if close_arr is None:
+        close_arr = close_tail(df)
+    
+    price = close_arr[-1]
+    ma10, ma20, ma50 = ma_arr[-1]
     
     # Điều kiện 1: Convergence strength > 75% (siêu xoắn)
     strength = convergence.get('convergence_strength', 0)
@@ -371,7 +431,8 @@ def detect_tight_convergence(df, convergence, death_cross):
         return {'is_tight': False, 'strength': strength, 'message': ''}
     
     # Điều kiện 3: Perfect Order HOẶC gần đạt HOẶC convergence CỰC mạnh
-    perfect_order = (ma10 > ma20 > ma50)
+    if perfect_order is None:
+        perfect_order = (ma10 > ma20 > ma50)
     near_perfect_order = (ma10 > ma20 and ma20 >= ma50 * 0.998)
     ultra_tight = (strength >= 95)
     
@@ -9,13 +9,16 @@ Momentum = slope của MA trong lookback period (% change per day)
 Pure functions - no side effects.
 """
 
+from .ma_detector import ma_tail
 
-def analyze_momentum(df):
+
+def analyze_momentum(df, ma_arr=None):
     """
     Phân tích momentum (tốc độ thay đổi) của từng MA để dự đoán xu hướng tương lai
     
     Args:
         df: DataFrame with MA10, MA20, MA50 columns
+        ma_arr: Optional ma_tail(df) array (built here if None)
         
     Returns:
         dict: {
@@ -35,12 +38,13 @@ def analyze_momentum(df):
             'summary': 'Không đủ dữ liệu'
         }
     
-    latest = df.iloc[-1]
+    if ma_arr is None:
+        ma_arr = ma_tail(df)
     
-    # Tính slope cho từng MA
-    ma10_slope = _calc_ma_slope(df, latest, 'MA10', 5)
-    ma20_slope = _calc_ma_slope(df, latest, 'MA20', 10)
-    ma50_slope = _calc_ma_slope(df, latest, 'MA50', 20)
+    # Tính slope cho từng MA (plain ndarray access - no row Series)
+    ma10_slope = _calc_ma_slope(ma_arr[:, 0], 5)
+    ma20_slope = _calc_ma_slope(ma_arr[:, 1], 10)
+    ma50_slope = _calc_ma_slope(ma_arr[:, 2], 20)
     
     ma10_analysis = _interpret_slope(ma10_slope)
     ma20_analysis = _interpret_slope(ma20_slope)
@@ -84,24 +88,22 @@ def analyze_momentum(df):
     }
 
 
-def _calc_ma_slope(df, latest, ma_name, lookback_days):
+def _calc_ma_slope(ma_values, lookback_days):
     """
     Tính slope của MA trong N ngày gần nhất
     
     Args:
-        df: DataFrame
-        latest: Latest row from df
-        ma_name: Name of MA column (MA10/MA20/MA50)
+        ma_values: MA column as ndarray (MA10/MA20/MA50)
         lookback_days: Number of days to look back
         
     Returns:
         float: % change per day
     """
-    if len(df) < lookback_days:
+    if ma_values.shape[0] < lookback_days:
         return 0
     
-    ma_current = latest[ma_name]
-    ma_past = df.iloc[-lookback_days][ma_name]
+    ma_current = ma_values[-1]
+    ma_past = ma_values[-lookback_days]
     
     if ma_past == 0:
         return 0
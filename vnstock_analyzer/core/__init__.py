@@ -3,6 +3,8 @@ Core components for vnstock analyzer
 """
 
 from .data_fetcher import DataFetcher
+from .cache import disk_cache
+from .rate_limit import RateLimiter, VCI_RATE_LIMITER
 from .constants import (
     WEIGHTS,
     TIERS,
@@ -23,6 +25,9 @@ from .constants import (
 
 __all__ = [
     'DataFetcher',
+    'disk_cache',
+    'RateLimiter',
+    'VCI_RATE_LIMITER',
     'WEIGHTS',
     'TIERS',
     'TIER_LABELS',
@@ -0,0 +1,79 @@
+"""
+Disk cache module - Cache kết quả phân tích trên đĩa để tránh gọi lại vnstock API
+"""
+
+import os
+import time
+import pickle
+import hashlib
+import tempfile
+import functools
+
+
+def get_cache_dir():
+    """
+    Get cache directory (respects XDG_CACHE_HOME)
+
+    Returns:
+        str: Path to ~/.cache/vnstock_analyzer (or $XDG_CACHE_HOME/vnstock_analyzer)
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'vnstock_analyzer')
+
+
+def disk_cache(ttl_seconds=3600, namespace='default', key=None, cache_if=None):
+    """
+    Decorator: cache function results as pickle files on disk
+
+    Cache errors (permissions, corrupt files...) never break the wrapped
+    function - they are treated as a cache miss.
+
+    Args:
+        ttl_seconds: Time-to-live of a cache entry
+        namespace: Sub-directory name under the cache dir
+        key: Callable(*args, **kwargs) -> hashable key, or None to bypass cache
+        cache_if: Callable(result) -> bool, only results passing it are stored
+
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            if cache_key is None:
+                return func(*args, **kwargs)
+
+            digest = hashlib.sha1(repr(cache_key).encode('utf-8')).hexdigest()
+            path = os.path.join(get_cache_dir(), namespace, f"{digest}.pkl")
+
+            # 1. Try cache hit
+            try:
+                if time.time() - os.path.getmtime(path) < ttl_seconds:
+                    with open(path, 'rb') as f:
+                        return pickle.load(f)
+            except Exception:
+                pass
+
+            # 2. Miss - compute and store
+            result = func(*args, **kwargs)
+
+            if cache_if is None or cache_if(result):
+                tmp_path = None
+                try:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    # Unique temp file per write - threads of one process may store the same key
+                    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+                    with os.fdopen(fd, 'wb') as f:
+                        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(tmp_path, path)
+                except Exception:
+                    if tmp_path is not None:
+                        try:
+                            os.remove(tmp_path)
+                        except OSError:
+                            pass
+
+            return result
+        return wrapper
+    return decorator
@@ -2,6 +2,8 @@
 Constants and thresholds for stock scoring system
 """
 
+from functools import lru_cache
+
 # Status-based evaluation system (using English labels as requested)
 STATUS_LEVELS = {
     'EXCELLENT': {'icon': '🔥', 'label': 'EXCELLENT', 'weight': 1.0},
@@ -159,30 +161,92 @@ INDUSTRY_WEIGHTS = {
 
 
 # Helper functions for status-based evaluation
-def calculate_component_score(criteria):
+
+# Status -> key trong kết quả count_criteria_by_status()
+STATUS_COUNT_KEYS = {
+    'EXCELLENT': 'excellent',
+    'GOOD': 'good',
+    'ACCEPTABLE': 'acceptable',
+    'WARNING': 'warning',
+    'POOR': 'poor',
+    'NA': 'na'
+}
+
+
+@lru_cache(maxsize=4096)
+def _summarize_statuses(statuses):
     """
-    Calculate component score based on status distribution
+    Cached core of summarize_criteria - keyed by the tuple of statuses
     
     Args:
-        criteria: Dict of {criterion_name: {'status': 'GOOD', 'reason': '...'}}
+        statuses: Tuple of status strings (one per criterion)
         
     Returns:
-        float: Score 0-1 representing quality
+        tuple: (component_score 0-1, status counts dict) - counts must not be mutated
     """
-    if not criteria:
-        return 0.0
-    
+    counts = {
+        'total': 0,
+        'excellent': 0,
+        'good': 0,
+        'acceptable': 0,
+        'warning': 0,
+        'poor': 0,
+        'na': 0
+    }
     total_weight = 0.0
     total_criteria = 0
     
-    for criterion_data in criteria.values():
-        status = criterion_data.get('status') if isinstance(criterion_data, dict) else criterion_data
+    for status in statuses:
+        counts['total'] += 1
+        
+        count_key = STATUS_COUNT_KEYS.get(status)
+        if count_key is not None:
+            counts[count_key] += 1
+        
         weight = STATUS_LEVELS.get(status, {}).get('weight')
         if weight is not None:  # Exclude NA
             total_weight += weight
             total_criteria += 1
     
-    return total_weight / total_criteria if total_criteria > 0 else 0.0
+    score = total_weight / total_criteria if total_criteria > 0 else 0.0
+    return score, counts
+
+
+def summarize_criteria(criteria):
+    """
+    Single pass over criteria: status counts + component score together
+    
+    Results are memoized by status tuple - the same status mix is only scored once.
+    
+    Args:
+        criteria: Dict of {criterion_name: {'status': 'GOOD', 'reason': '...'}}
+                  (status string values are accepted too)
+        
+    Returns:
+        tuple: (component_score 0-1, status counts dict)
+    """
+    statuses = tuple(
+        criterion_data.get('status', 'NA') if isinstance(criterion_data, dict) else criterion_data
+        for criterion_data in criteria.values()
+    )
+    score, counts = _summarize_statuses(statuses)
+    return score, dict(counts)
+
+
+def calculate_component_score(criteria):
+    """
+    Calculate component score based on status distribution
+    
+    Args:
+        criteria: Dict of {criterion_name: {'status': 'GOOD', 'reason': '...'}}
+        
+    Returns:
+        float: Score 0-1 representing quality
+    """
+    if not criteria:
+        return 0.0
+    
+    return summarize_criteria(criteria)[0]
 
 
 def calculate_overall_tier(component_scores, weights=None):
@@ -226,31 +290,4 @@ def count_criteria_by_status(criteria_dict):
     Returns:
         dict: Status counts
     """
-    counts = {
-        'total': 0,
-        'excellent': 0,
-        'good': 0,
-        'acceptable': 0,
-        'warning': 0,
-        'poor': 0,
-        'na': 0
-    }
-    
-    for criterion in criteria_dict.values():
-        status = criterion.get('status', 'NA')
-        counts['total'] += 1
-        
-        if status == 'EXCELLENT':
-            counts['excellent'] += 1
-        elif status == 'GOOD':
-            counts['good'] += 1
-        elif status == 'ACCEPTABLE':
-            counts['acceptable'] += 1
-        elif status == 'WARNING':
-            counts['warning'] += 1
-        elif status == 'POOR':
-            counts['poor'] += 1
-        elif status == 'NA':
-            counts['na'] += 1
-    
-    return counts
+    return summarize_criteria(criteria_dict)[1]
@@ -5,8 +5,13 @@ Data fetcher module - Fetch và cache data từ vnstock API với error handling
 import sys
 import time
 from datetime import datetime, timedelta
+
+# Apply patches for vnstock compatibility with pandas 3.x (before vnstock is used)
+from .. import vnstock_patch
 from vnstock import Vnstock
 
+from .rate_limit import VCI_RATE_LIMITER
+
 
 class DataFetcher:
     """Fetch và cache data với retry logic và graceful degradation"""
@@ -23,6 +28,8 @@ class DataFetcher:
         self.source = source
         self.stock = Vnstock().stock(symbol=symbol, source=source)
         self.data_cache = {}
+        # VCI requests share one process-wide limiter (batch scripts fetch from several threads)
+        self.rate_limiter = VCI_RATE_LIMITER if source == 'VCI' else None
         
         # Retry configuration
         self.max_retries = 3
@@ -43,6 +50,8 @@ class DataFetcher:
         """
         for attempt in range(1, self.max_retries + 1):
             try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
                 result = func(*args, **kwargs)
                 
                 # Validate result
@@ -0,0 +1,43 @@
+"""
+Rate limit module - Giới hạn số request tới vnstock API (dùng chung giữa các thread)
+"""
+
+import time
+import threading
+from collections import deque
+
+
+# VCI rate limit: 20 requests/minute (same limit as scripts/fetch_prices.py)
+VCI_RATE_LIMIT_CALLS = 20
+VCI_RATE_LIMIT_PERIOD = 60  # seconds
+
+
+class RateLimiter:
+    """Thread-safe sliding-window rate limiter: at most `max_calls` starts per `period` seconds"""
+    
+    def __init__(self, max_calls, period):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a new request is allowed"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                
+                wait = self.period - (now - self._calls[0])
+            
+            # Sleep outside the lock so other threads can re-check the window
+            time.sleep(wait)
+
+
+# Shared by every DataFetcher using the VCI source in this process
+VCI_RATE_LIMITER = RateLimiter(VCI_RATE_LIMIT_CALLS, VCI_RATE_LIMIT_PERIOD)
@@ -3,9 +3,10 @@ Stock Scorer - Main orchestrator for stock analysis
 """
 
 import sys
-from datetime import datetime
+from datetime import date, datetime
 
-from .core import DataFetcher
+from . import __version__
+from .core import DataFetcher, disk_cache
 from .analyzers import (
     TechnicalAnalyzer,
 )
@@ -15,16 +16,18 @@ from .utils import get_logger, LogLevel
 class StockScorer:
     """Main scoring engine - orchestrates all analyzers"""
     
-    def __init__(self, symbol, source='VCI'):
+    def __init__(self, symbol, source='VCI', use_cache=True):
         """
         Initialize stock scorer với safe initialization
         
         Args:
             symbol: Stock symbol (e.g., 'HDB', 'FPT')
             source: Data source (default: 'VCI')
+            use_cache: Reuse today's cached analyze() result if available
         """
         self.symbol = symbol
         self.source = source
+        self.use_cache = use_cache
         self.logger = get_logger(symbol, LogLevel.INFO)
         
         # Lazy initialization - không fetch data trong constructor
@@ -43,6 +46,13 @@ class StockScorer:
                 return False
         return True
         
+    @disk_cache(
+        ttl_seconds=3600,
+        namespace='analyze',
+        # Key includes version so results are dropped after logic changes
+        key=lambda self: (self.symbol, self.source, date.today().isoformat(), __version__) if self.use_cache else None,
+        cache_if=lambda result: bool(result) and 'error' not in result
+    )
     def analyze(self):
         """
         Phân tích toàn diện - FACTUAL DATA ONLY (NO ADVICE)
@@ -6,6 +6,12 @@ import sys
 import json
 import numpy as np
 
+# orjson is optional - C encoder, much faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class NumpyEncoder(json.JSONEncoder):
     """Custom JSON encoder for numpy types"""
@@ -195,18 +201,25 @@ def print_report(result, file=sys.stderr):
     print(f"{'='*60}\n", file=file)
 
 
-def export_json(result, filepath=None):
+def export_json(result, filepath=None, pretty=True):
     """
     Export result to JSON (with numpy support)
     
     Args:
         result: Analysis result dictionary
         filepath: Optional file path to save JSON
+        pretty: Indent output (False = compact single line, e.g. for NDJSON)
         
     Returns:
         str: JSON string
     """
-    json_str = json.dumps(result, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        json_str = orjson.dumps(result, option=option).decode('utf-8')
+    else:
+        json_str = json.dumps(result, indent=2 if pretty else None, ensure_ascii=False, cls=NumpyEncoder)
     
     if filepath:
         with open(filepath, 'w', encoding='utf-8') as f:
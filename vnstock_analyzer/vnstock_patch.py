@@ -4,8 +4,8 @@ Monkey patch for vnstock to fix pandas 3.x compatibility issues.
 This patch automatically fixes the deprecated applymap() usage in vnstock
 when working with pandas 3.0+, which removed applymap() in favor of map().
 
-The patch is applied automatically when importing vnstock_analyzer and
-runs silently without user-facing messages.
+The patch is applied automatically when the data fetcher (the only vnstock
+consumer) is imported, and runs silently without user-facing messages.
 
 Technical details:
 - vnstock 3.4.2 uses DataFrame.applymap() which was removed in pandas 3.0